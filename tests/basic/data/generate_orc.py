@@ -1,26 +1,63 @@
+import os
+import sys
 import shutil
 import glob
 from datetime import date
-from pyspark.sql import SparkSession
-from pyspark.sql.types import *
+import pyarrow as pa
+import pyarrow.orc as orc
+
+# TODO: int8, char, varchar, decimal, timestamp, struct, list, map, union
+rows = [
+    # bool,         int16,         int32,         int64,       float32,        float64,              binary,       utf8,             date32
+    ( None,          None,          None,          None,          None,           None,                None,       None,               None),
+    ( True,             0,             0,             0,           0.0,            0.0,         "".encode(),         "", date(1970,  1,  1)),
+    (False,             1,             1,             1,           1.0,            1.0,        "a".encode(),        "a", date(1970,  1,  2)),
+    (False,            -1,            -1,            -1,          -1.0,           -1.0,        " ".encode(),        " ", date(1969, 12, 31)),
+    ( True, (1 << 15) - 1, (1 << 31) - 1, (1 << 63) - 1,  float("inf"),   float("inf"),   "encode".encode(),   "encode", date(9999, 12, 31)),
+    ( True,    -(1 << 15),    -(1 << 31),    -(1 << 63), float("-inf"),  float("-inf"),   "decode".encode(),   "decode", date(1582, 10, 15)),
+    ( True,            50,            50,            50,     3.1415927,  3.14159265359, "大熊和奏".encode(), "大熊和奏", date(1582, 10, 16)),
+    ( True,            51,            51,            51,    -3.1415927, -3.14159265359, "斉藤朱夏".encode(), "斉藤朱夏", date(2000,  1,  1)),
+    ( True,            52,            52,            52,           1.1,            1.1, "鈴原希実".encode(), "鈴原希実", date(3000, 12, 31)),
+    (False,            53,            53,            53,          -1.1,           -1.1,       "🤔".encode(),       "🤔", date(1900,  1,  1)),
+    ( None,          None,          None,          None,          None,           None,                None,       None,               None),
+]
+
+schema = pa.schema(
+    [
+        pa.field("boolean",     pa.bool_()),
+        pa.field(  "int16",     pa.int16()),
+        pa.field(  "int32",     pa.int32()),
+        pa.field(  "int64",     pa.int64()),
+        pa.field("float32",   pa.float32()),
+        pa.field("float64",   pa.float64()),
+        pa.field( "binary",    pa.binary()),
+        pa.field(   "utf8",    pa.string()),
+        pa.field( "date32",    pa.date32()),
+    ]
+)
+table = pa.Table.from_arrays(
+    [pa.array(values, type=field.type) for values, field in zip(zip(*rows), schema)],
+    schema=schema,
+)
+
+# pyarrow covers every codec except lzo, which avoids spinning up a JVM
+compression = ["none", "snappy", "zlib", "zstd", "lz4"]
+for c in compression:
+    orc.write_table(table, f"./alltypes.{c}.orc", compression={"none": "uncompressed"}.get(c, c))
+
+# Only Spark can write lzo (liborc, behind pyarrow and pyorc, can only decompress it).
+# alltypes.lzo.orc is checked in, so Spark is only needed when the rows above change.
+try:
+    from pyspark.sql import SparkSession
+    from pyspark.sql.types import *
+except ImportError:
+    print("pyspark is not installed, skipping alltypes.lzo.orc")
+    sys.exit(0)
 
 spark = SparkSession.builder.getOrCreate()
 
-# TODO: int8, char, varchar, decimal, timestamp, struct, list, map, union
 df = spark.createDataFrame(
-    [ #   bool,         int16,         int32,         int64,       float32,        float64,              binary,       utf8,             date32
-        ( None,          None,          None,          None,          None,           None,                None,       None,               None),
-        ( True,             0,             0,             0,           0.0,            0.0,         "".encode(),         "", date(1970,  1,  1)),
-        (False,             1,             1,             1,           1.0,            1.0,        "a".encode(),        "a", date(1970,  1,  2)),
-        (False,            -1,            -1,            -1,          -1.0,           -1.0,        " ".encode(),        " ", date(1969, 12, 31)),
-        ( True, (1 << 15) - 1, (1 << 31) - 1, (1 << 63) - 1,  float("inf"),   float("inf"),   "encode".encode(),   "encode", date(9999, 12, 31)),
-        ( True,    -(1 << 15),    -(1 << 31),    -(1 << 63), float("-inf"),  float("-inf"),   "decode".encode(),   "decode", date(1582, 10, 15)),
-        ( True,            50,            50,            50,     3.1415927,  3.14159265359, "大熊和奏".encode(), "大熊和奏", date(1582, 10, 16)),
-        ( True,            51,            51,            51,    -3.1415927, -3.14159265359, "斉藤朱夏".encode(), "斉藤朱夏", date(2000,  1,  1)),
-        ( True,            52,            52,            52,           1.1,            1.1, "鈴原希実".encode(), "鈴原希実", date(3000, 12, 31)),
-        (False,            53,            53,            53,          -1.1,           -1.1,       "🤔".encode(),       "🤔", date(1900,  1,  1)),
-        ( None,          None,          None,          None,          None,           None,                None,       None,               None),
-    ],
+    rows,
     StructType(
         [
             StructField("boolean", BooleanType()),
@@ -36,14 +73,12 @@ df = spark.createDataFrame(
     ),
 ).coalesce(1)
 
-compression = ["none", "snappy", "zlib", "lzo", "zstd", "lz4"]
-for c in compression:
-    df.write.format("orc")\
-      .option("compression", c)\
-      .mode("overwrite")\
-      .save(f"./alltypes.{c}")
-    # Since Spark saves into a directory
-    # Move out and rename the expected single ORC file (because of coalesce above)
-    orc_file = glob.glob(f"./alltypes.{c}/*.orc")[0]
-    shutil.move(orc_file, f"./alltypes.{c}.orc")
-    shutil.rmtree(f"./alltypes.{c}")
+df.write.format("orc")\
+  .option("compression", "lzo")\
+  .mode("overwrite")\
+  .save("./alltypes.lzo")
+# Since Spark saves into a directory
+# Move out and rename the expected single ORC file (because of coalesce above)
+orc_file = glob.glob("./alltypes.lzo/*.orc")[0]
+os.replace(orc_file, "./alltypes.lzo.orc")
+shutil.rmtree("./alltypes.lzo")
@@ -1,6 +1,8 @@
 # Copied from https://github.com/DataEngineeringLabs/orc-format/blob/416490db0214fc51d53289253c0ee91f7fc9bc17/write.py
-import random
 import datetime
+import numpy as np
+import pyarrow as pa
+import pyarrow.orc as orc
 import pyorc
 
 data = {
@@ -26,39 +28,40 @@ data = {
     "tinyint_simple": [-1, None, 1, 127, -127]
 }
 
+TYPE_MAP = {float: "float", bool: "boolean", int: "int", str: "string"}
+# column name prefixes that pin the ORC type regardless of the Python value type
+PREFIX_MAP = (
+    ("double", "double"),
+    ("bigint", "bigint"),
+    ("tinyint", "tinyint"),
+    ("timestamp", "timestamp"),
+    ("date", "date"),
+)
+
 def infer_schema(data):
-    schema = "struct<"
+    fields = []
     for key, value in data.items():
         dt = type(value[0])
-        if dt == float:
-            dt = "float"
-        elif dt == int:
-            dt = "int"
-        elif dt == bool:
-            dt = "boolean"
-        elif dt == str:
-            dt = "string"
-        elif dt == dict: 
+        if dt == dict:
             dt = infer_schema(value[0])
-        elif key.startswith("timestamp"):
-            dt = "timestamp"
-        elif key.startswith("date"):
-            dt = "date"
         else:
-            print(key,value,dt)
+            dt = TYPE_MAP.get(dt)
+        for prefix, name in PREFIX_MAP:
+            if key.startswith(prefix):
+                dt = name
+                break
+        if dt is None:
+            print(key,value,type(value[0]))
             raise NotImplementedError
-        if key.startswith("double"):
-            dt = "double"
-        if key.startswith("bigint"):
-            dt = "bigint"
-        if key.startswith("tinyint"):
-            dt = "tinyint"
-        schema += key + ":" + dt + ","
+        fields.append(f"{key}:{dt}")
+
+    return "struct<" + ",".join(fields) + ">"
 
-    schema = schema[:-1] + ">"
-    return schema
 
 
+# use a small number to ensure that compression crosses value boundaries
+SMALL_BLOCK_SIZE = 32
+
 
 def _write(
     schema: str,
@@ -66,25 +69,43 @@ def _write(
     file_name: str,
     compression=pyorc.CompressionKind.NONE,
     dict_key_size_threshold=0.0,
+    compression_block_size=262_144,
+    verify=False,
 ):
     output = open(file_name, "wb")
     writer = pyorc.Writer(
         output,
         schema,
         dict_key_size_threshold=dict_key_size_threshold,
-        # use a small number to ensure that compression crosses value boundaries
-        compression_block_size=32,
+        compression_block_size=compression_block_size,
         compression=compression,
     )
-    num_rows = len(list(data.values())[0])
-    for x in range(num_rows):
-        row = tuple(values[x] for values in data.values())
-        writer.write(row)
+    writer.writerows(zip(*data.values()))
     writer.close()
 
-    with open(file_name, "rb") as f:
-        reader = pyorc.Reader(f)
-        list(reader)
+    if verify:
+        with open(file_name, "rb") as f:
+            reader = pyorc.Reader(f)
+            for _ in reader:
+                pass
+
+
+def _write_pa(
+    schema: pa.Schema,
+    data,
+    file_name: str,
+    compression="uncompressed",
+    dictionary_key_size_threshold=0.0,
+    compression_block_size=262_144,
+):
+    table = pa.Table.from_pydict(data, schema=schema)
+    orc.write_table(
+        table,
+        file_name,
+        compression=compression,
+        compression_block_size=compression_block_size,
+        dictionary_key_size_threshold=dictionary_key_size_threshold,
+    )
 
 nested_struct = {
     "nest": [
@@ -96,7 +117,7 @@ nested_struct = {
     ],
 }
 
-_write("struct<nest:struct<a:float,b:boolean>>", nested_struct, "nested_struct.orc")
+_write("struct<nest:struct<a:float,b:boolean>>", nested_struct, "nested_struct.orc", compression_block_size=SMALL_BLOCK_SIZE)
 
 nested_array = {
     "value": [
@@ -108,7 +129,7 @@ nested_array = {
     ],
 }
 
-_write("struct<value:array<int>>", nested_array, "nested_array.orc")
+_write("struct<value:array<int>>", nested_array, "nested_array.orc", compression_block_size=SMALL_BLOCK_SIZE)
 
 nested_map = {
     "map": [
@@ -119,46 +140,47 @@ nested_map = {
     ],
 }
 
-_write("struct<map:map<string,int>>", nested_map, "nested_map.orc")
+_write("struct<map:map<string,int>>", nested_map, "nested_map.orc", compression_block_size=SMALL_BLOCK_SIZE)
 
 
 _write(
     infer_schema(data),
     data,
     "test.orc",
+    compression_block_size=SMALL_BLOCK_SIZE,
 )
 
 data_boolean = {
     "long": [True] * 32,
 }
 
-_write("struct<long:boolean>", data_boolean, "long_bool.orc")
+_write_pa(pa.schema([("long", pa.bool_())]), data_boolean, "long_bool.orc", compression_block_size=SMALL_BLOCK_SIZE)
 
-_write("struct<long:boolean>", data_boolean, "long_bool_gzip.orc", pyorc.CompressionKind.ZLIB)
+_write_pa(pa.schema([("long", pa.bool_())]), data_boolean, "long_bool_gzip.orc", "zlib", compression_block_size=SMALL_BLOCK_SIZE)
 
 data_dict = {
     "dict": ["abcd", "efgh"] * 32,
 }
 
-_write("struct<dict:string>", data_dict, "string_long.orc")
+_write_pa(pa.schema([("dict", pa.string())]), data_dict, "string_long.orc", compression_block_size=SMALL_BLOCK_SIZE)
 
 data_dict = {
     "dict": ["abc", "efgh"] * 32,
 }
 
-_write("struct<dict:string>", data_dict, "string_dict.orc", dict_key_size_threshold=0.1)
+_write_pa(pa.schema([("dict", pa.string())]), data_dict, "string_dict.orc", dictionary_key_size_threshold=0.1, compression_block_size=SMALL_BLOCK_SIZE)
 
-_write("struct<dict:string>", data_dict, "string_dict_gzip.orc", pyorc.CompressionKind.ZLIB)
+_write_pa(pa.schema([("dict", pa.string())]), data_dict, "string_dict_gzip.orc", "zlib", compression_block_size=SMALL_BLOCK_SIZE)
 
 data_dict = {
     "dict": ["abcd", "efgh"] * (10**4 // 2),
 }
 
-_write("struct<dict:string>", data_dict, "string_long_long.orc")
-_write("struct<dict:string>", data_dict, "string_long_long_gzip.orc", pyorc.CompressionKind.ZLIB)
+_write_pa(pa.schema([("dict", pa.string())]), data_dict, "string_long_long.orc")
+_write_pa(pa.schema([("dict", pa.string())]), data_dict, "string_long_long_gzip.orc", "zlib")
 
 long_f32 = {
-    "dict": [random.uniform(0, 1) for _ in range(10**6)],
+    "dict": np.random.default_rng(0).random(10**6, dtype=np.float32),
 }
 
-_write("struct<dict:float>", long_f32, "f32_long_long_gzip.orc", pyorc.CompressionKind.ZLIB)
+_write_pa(pa.schema([("dict", pa.float32())]), long_f32, "f32_long_long_gzip.orc", "zlib")